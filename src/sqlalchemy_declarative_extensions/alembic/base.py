@@ -52,6 +52,23 @@ def _traverse_any_directive(self, context, revision, directive) -> None:
     pass
 
 
+def render_execute(command: str) -> str:
+    """Render an `op.execute` call for the given command, as a triple-quoted literal.
+
+    The command is kept (multi-line) as-is, except for backslashes and quotes which
+    would otherwise end, or alter the content of, the literal.
+    """
+    command = command.replace("\\", "\\\\")
+
+    # A trailing quote would run together with the closing quotes.
+    end = ""
+    if command.endswith('"'):
+        command, end = command[:-1], '\\"'
+
+    command = command.replace('"""', '""\\"')
+    return f'op.execute("""{command}{end}""")'
+
+
 def register_comparator_dispatcher(fn, target: str):
     from alembic.autogenerate.compare import comparators
 
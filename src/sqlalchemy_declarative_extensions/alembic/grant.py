@@ -46,7 +46,7 @@ def compare_grants(autogen_context: AutogenContext, upgrade_ops: UpgradeOps, _):
 
 
 def render_grant(_, op: Operation):
-    return f'op.execute(sa.text("""{op.to_sql()}"""))'
+    return f'op.execute(sa.text("""{op._to_sql_str()}"""))'
 
 
 register_comparator_dispatcher(compare_grants, target="schema")
@@ -6,6 +6,7 @@ from sqlalchemy_declarative_extensions.alembic.base import (
     register_comparator_dispatcher,
     register_renderer_dispatcher,
     register_rewriter_dispatcher,
+    render_execute,
 )
 from sqlalchemy_declarative_extensions.procedure.base import Procedures
 from sqlalchemy_declarative_extensions.procedure.compare import (
@@ -30,7 +31,7 @@ def _compare_procedures(autogen_context: AutogenContext, upgrade_ops, _):
 def render_precedure(autogen_context: AutogenContext, op: Operation):
     assert autogen_context.connection
     commands = op.to_sql()
-    return [f'op.execute("""{command}""")' for command in commands]
+    return [render_execute(command) for command in commands]
 
 
 register_comparator_dispatcher(_compare_procedures, target="schema")
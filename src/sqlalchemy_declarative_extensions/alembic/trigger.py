@@ -6,6 +6,7 @@ from sqlalchemy_declarative_extensions.alembic.base import (
     register_comparator_dispatcher,
     register_renderer_dispatcher,
     register_rewriter_dispatcher,
+    render_execute,
 )
 from sqlalchemy_declarative_extensions.trigger.base import Triggers
 from sqlalchemy_declarative_extensions.trigger.compare import (
@@ -31,7 +32,7 @@ def render_trigger(autogen_context: AutogenContext, op: Operation):
     assert autogen_context.connection
     commands = op.to_sql(autogen_context.connection)
 
-    return [f'op.execute("""{command}""")' for command in commands]
+    return [render_execute(command) for command in commands]
 
 
 register_comparator_dispatcher(_compare_triggers, target="schema")
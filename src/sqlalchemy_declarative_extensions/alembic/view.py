@@ -6,6 +6,7 @@ from sqlalchemy_declarative_extensions.alembic.base import (
     register_comparator_dispatcher,
     register_renderer_dispatcher,
     register_rewriter_dispatcher,
+    render_execute,
 )
 from sqlalchemy_declarative_extensions.view.base import Views
 from sqlalchemy_declarative_extensions.view.compare import (
@@ -32,7 +33,7 @@ def render_view(autogen_context: AutogenContext, op: Operation):
     dialect = autogen_context.connection.dialect
     commands = op.to_sql(dialect)
 
-    return [f'op.execute("""{command}""")' for command in commands]
+    return [render_execute(command) for command in commands]
 
 
 register_comparator_dispatcher(_compare_views, target="schema")
@@ -36,16 +36,12 @@ from sqlalchemy_declarative_extensions.view.base import ViewIndex
 
 __all__ = [
     "DefaultGrant",
-    "DefaultGrant",
-    "DefaultGrantStatement",
     "DefaultGrantStatement",
     "DefaultGrantTypes",
     "Function",
     "FunctionGrants",
     "FunctionSecurity",
     "Grant",
-    "Grant",
-    "GrantStatement",
     "GrantStatement",
     "GrantTypes",
     "MaterializedOptions",
@@ -30,9 +30,11 @@ GRANT { USAGE | ALL [ PRIVILEGES ] }
 
 from __future__ import annotations
 
+import functools
 import itertools
-from dataclasses import dataclass, replace
-from typing import Generic
+import sys
+from dataclasses import dataclass, field, replace
+from typing import Any, Generic, Iterable, Iterator, TypeVar, cast
 
 from sqlalchemy.sql.elements import TextClause
 from sqlalchemy.sql.expression import text
@@ -43,13 +45,22 @@ from sqlalchemy_declarative_extensions.dialects.postgresql.grant_type import (
     GrantOptions,
     GrantTypes,
 )
-from sqlalchemy_declarative_extensions.sql import split_schema
-from sqlalchemy_declarative_extensions.typing import Protocol, runtime_checkable
+from sqlalchemy_declarative_extensions.sql import HasName, coerce_name, split_schema
+from sqlalchemy_declarative_extensions.typing import Protocol
 
 
-@runtime_checkable
-class HasName(Protocol):
-    name: str
+class _Comparable(Protocol):
+    def __lt__(self, other: Any) -> bool: ...
+
+
+T = TypeVar("T", bound=_Comparable)
+
+
+# `DefaultGrant`s are allocated in large numbers while diffing grants, so use
+# `__slots__` where `dataclass` supports it (python 3.10+). The `Generic` classes
+# cannot use it: subscripted construction (e.g. `Grant[TableGrants](...)`) sets
+# `__orig_class__`, which a slotted frozen dataclass rejects with a `TypeError`.
+_dataclass_options = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 @dataclass(frozen=True)
@@ -68,8 +79,8 @@ class Grant(Generic[G]):
         grant_option=False,
     ) -> Grant:
         return cls(
-            grants=tuple(sorted([grant, *grants])),  # type: ignore
-            target_role=_coerce_name(to),
+            grants=_sorted_tuple(itertools.chain((grant,), grants)),
+            target_role=coerce_name(to),
             grant_option=grant_option,
         )
 
@@ -81,10 +92,10 @@ class Grant(Generic[G]):
 
     def on_objects(self, *objects: str | HasName, object_type: GrantTypes):
         variants = object_type.to_variants()
-        grant = replace(self, grants=tuple(_map_grant_names(variants, *self.grants)))
+        grant = replace(self, grants=_map_grant_names(variants, *self.grants))
 
-        names = [_coerce_name(obj) for obj in objects]
-        return GrantStatement(grant, grant_type=object_type, targets=tuple(names))
+        names = tuple(coerce_name(obj) for obj in objects)
+        return GrantStatement(grant, grant_type=object_type, targets=names)
 
     def on_tables(self, *tables: str | HasName):
         return self.on_objects(*tables, object_type=GrantTypes.table)
@@ -99,7 +110,7 @@ class Grant(Generic[G]):
         return self.on_objects(*schemas, object_type=GrantTypes.schema)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_dataclass_options)
 class DefaultGrant:
     grant_type: DefaultGrantTypes
     in_schemas: tuple[str, ...]
@@ -112,8 +123,8 @@ class DefaultGrant:
         schemas = _map_schema_names(*in_schemas)
         return cls(
             grant_type=DefaultGrantTypes.table,
-            in_schemas=tuple(schemas),
-            target_role=_coerce_name(for_role) if for_role is not None else None,
+            in_schemas=schemas,
+            target_role=coerce_name(for_role) if for_role is not None else None,
         )
 
     @classmethod
@@ -123,8 +134,8 @@ class DefaultGrant:
         schemas = _map_schema_names(*in_schemas)
         return cls(
             grant_type=DefaultGrantTypes.sequence,
-            in_schemas=tuple(schemas),
-            target_role=_coerce_name(for_role) if for_role is not None else None,
+            in_schemas=schemas,
+            target_role=coerce_name(for_role) if for_role is not None else None,
         )
 
     @classmethod
@@ -134,8 +145,8 @@ class DefaultGrant:
         schemas = _map_schema_names(*in_schemas)
         return cls(
             grant_type=DefaultGrantTypes.type,
-            in_schemas=tuple(schemas),
-            target_role=_coerce_name(for_role) if for_role is not None else None,
+            in_schemas=schemas,
+            target_role=coerce_name(for_role) if for_role is not None else None,
         )
 
     @classmethod
@@ -145,12 +156,12 @@ class DefaultGrant:
         schemas = _map_schema_names(*in_schemas)
         return cls(
             grant_type=DefaultGrantTypes.function,
-            in_schemas=tuple(schemas),
-            target_role=_coerce_name(for_role) if for_role is not None else None,
+            in_schemas=schemas,
+            target_role=coerce_name(for_role) if for_role is not None else None,
         )
 
-    def for_role(self, role: HasName | str):
-        return replace(self, target_role=_coerce_name(role))
+    def for_role(self, role: HasName | str) -> DefaultGrant:
+        return replace(self, target_role=coerce_name(role))
 
     def grant(
         self,
@@ -161,10 +172,8 @@ class DefaultGrant:
     ):
         if not isinstance(grant, Grant):
             grant = Grant(
-                grants=tuple(
-                    _map_grant_names(self.grant_type.to_variants(), grant, *grants)
-                ),
-                target_role=_coerce_name(to),
+                grants=_map_grant_names(self.grant_type.to_variants(), grant, *grants),
+                target_role=coerce_name(to),
                 grant_option=grant_option,
             )
         return DefaultGrantStatement(self, grant)
@@ -175,53 +184,59 @@ class DefaultGrantStatement(Generic[G]):
     default_grant: DefaultGrant
     grant: Grant[G]
 
+    _sql: str | None = field(default=None, init=False, repr=False, compare=False)
+
     def for_role(self, role: str | HasName) -> DefaultGrantStatement:
-        return replace(
-            self,
-            default_grant=replace(self.default_grant, target_role=_coerce_name(role)),
-        )
+        return replace(self, default_grant=self.default_grant.for_role(role))
 
     def invert(self) -> DefaultGrantStatement:
         return replace(self, grant=replace(self.grant, revoke_=not self.grant.revoke_))
 
     def to_sql(self) -> TextClause:
-        result = []
-
-        result.append("ALTER DEFAULT PRIVILEGES")
-
-        if self.default_grant.target_role:
-            result.append(f'FOR ROLE "{self.default_grant.target_role}"')
-
-        schemas_str = ", ".join([f'"{t}"' for t in self.default_grant.in_schemas])
-        result.append(f"IN SCHEMA {schemas_str}")
-
-        result.append(_render_grant_or_revoke(self.grant))
-        result.append(_render_privilege(self.grant, self.default_grant.grant_type))
-
-        result.append(f"ON {self.default_grant.grant_type.value}S")
-        result.append(_render_to_or_from(self.grant))
+        return text(self._to_sql_str())
+
+    def _to_sql_str(self) -> str:
+        # The statement is immutable, so the rendered text is computed at most once.
+        sql = self._sql
+        if sql is None:
+            sql = self._render()
+            object.__setattr__(self, "_sql", sql)
+        return sql
+
+    def _render(self) -> str:
+        default_grant = self.default_grant
+        grant_type = default_grant.grant_type
+        grant = self.grant
+
+        target_role = default_grant.target_role
+        for_role = f'FOR ROLE "{target_role}" ' if target_role else ""
+        schemas = ", ".join(f'"{s}"' for s in default_grant.in_schemas)
+        grant_or_revoke = "REVOKE" if grant.revoke_ else "GRANT"
+        privilege = _render_privilege(grant_type.to_variants(), grant.grants)
+        role = f'"{grant.target_role}"'
+        to_or_from = f"FROM {role}" if grant.revoke_ else f"TO {role}"
+
+        # ALTER DEFAULT PRIVILEGES [FOR ROLE r] IN SCHEMA s, ...
+        #     {GRANT|REVOKE} privileges ON {type}S {TO|FROM} role;
+        # A single f-string, since it compiles to bytecode (unlike `str.format`).
+        return (
+            f"ALTER DEFAULT PRIVILEGES {for_role}IN SCHEMA {schemas} "
+            f"{grant_or_revoke} {privilege} ON {grant_type.value}S {to_or_from};"
+        )
 
-        text_result = " ".join(result)
-        return text(text_result + ";")
+    def explode(self) -> Iterator[DefaultGrantStatement]:
+        grant_type = self.default_grant.grant_type
+        default_target_role = self.default_grant.target_role
+        grants = _explode_grant(self.grant)
 
-    def explode(self):
-        return [
-            DefaultGrantStatement(
-                default_grant=DefaultGrant(
-                    grant_type=self.default_grant.grant_type,
-                    in_schemas=(schema,),
-                    target_role=self.default_grant.target_role,
-                ),
-                grant=Grant(
-                    grants=(grant,),
-                    target_role=self.grant.target_role,
-                    grant_option=self.grant.grant_option,
-                    revoke_=self.grant.revoke_,
-                ),
+        for schema in self.default_grant.in_schemas:
+            default_grant = DefaultGrant(
+                grant_type=grant_type,
+                in_schemas=(schema,),
+                target_role=default_target_role,
             )
-            for schema in self.default_grant.in_schemas
-            for grant in self.grant.grants
-        ]
+            for grant in grants:
+                yield DefaultGrantStatement(default_grant=default_grant, grant=grant)
 
     @classmethod
     def combine(cls, grants: list[DefaultGrantStatement]):
@@ -268,44 +283,76 @@ class GrantStatement(Generic[G]):
     grant_type: GrantTypes
     targets: tuple[str, ...]
 
+    _targets_set: frozenset[str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _grants_set: frozenset[str | G] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _sql: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def targets_set(self) -> frozenset[str]:
+        """Return the statement's targets, for constant-time membership checks."""
+        targets_set = self._targets_set
+        if targets_set is None:
+            targets_set = frozenset(self.targets)
+            object.__setattr__(self, "_targets_set", targets_set)
+        return targets_set
+
+    @property
+    def grants_set(self) -> frozenset[str | G]:
+        """Return the statement's privileges, for constant-time membership checks."""
+        grants_set = self._grants_set
+        if grants_set is None:
+            grants_set = frozenset(self.grant.grants)
+            object.__setattr__(self, "_grants_set", grants_set)
+        return grants_set
+
     def invert(self) -> GrantStatement:
         return replace(self, grant=replace(self.grant, revoke_=not self.grant.revoke_))
 
     def for_role(self, role: str | HasName) -> GrantStatement:
-        return replace(self, grant=replace(self.grant, target_role=_coerce_name(role)))
+        return replace(self, grant=replace(self.grant, target_role=coerce_name(role)))
 
     def to_sql(self) -> TextClause:
-        result = []
-
-        result.append(_render_grant_or_revoke(self.grant))
-        result.append(_render_privilege(self.grant, self.grant_type))
-        result.append(f"ON {self.grant_type.value}")
-
-        result.append(", ".join([_quote_table_name(t) for t in self.targets]))
-        result.append(_render_to_or_from(self.grant))
-
-        grant_option = _render_grant_option(self.grant)
-        if grant_option:
-            result.append(grant_option)
+        return text(self._to_sql_str())
+
+    def _to_sql_str(self) -> str:
+        # The statement is immutable, so the rendered text is computed at most once.
+        sql = self._sql
+        if sql is None:
+            sql = self._render()
+            object.__setattr__(self, "_sql", sql)
+        return sql
+
+    def _render(self) -> str:
+        grant = self.grant
+
+        grant_or_revoke = "REVOKE" if grant.revoke_ else "GRANT"
+        privilege = _render_privilege(self.grant_type.to_variants(), grant.grants)
+        targets = ", ".join(_quote_table_name(t) for t in self.targets)
+        role = f'"{grant.target_role}"'
+        to_or_from = f"FROM {role}" if grant.revoke_ else f"TO {role}"
+        grant_option = " WITH GRANT OPTION" if grant.grant_option else ""
+
+        # {GRANT|REVOKE} privileges ON type target, ...
+        #     {TO|FROM} role [WITH GRANT OPTION];
+        return (
+            f"{grant_or_revoke} {privilege} ON {self.grant_type.value} {targets} "
+            f"{to_or_from}{grant_option};"
+        )
 
-        text_result = " ".join(result)
-        return text(text_result + ";")
+    def explode(self) -> Iterator[GrantStatement]:
+        grant_type = self.grant_type
+        grants = _explode_grant(self.grant)
 
-    def explode(self):
-        return [
-            GrantStatement(
-                grant=Grant(
-                    grants=(grant,),
-                    target_role=self.grant.target_role,
-                    grant_option=self.grant.grant_option,
-                    revoke_=self.grant.revoke_,
-                ),
-                grant_type=self.grant_type,
-                targets=(target,),
-            )
-            for target in self.targets
-            for grant in self.grant.grants
-        ]
+        for target in self.targets:
+            targets = (target,)
+            for grant in grants:
+                yield GrantStatement(
+                    grant=grant, grant_type=grant_type, targets=targets
+                )
 
     @classmethod
     def combine(cls, grants: list[GrantStatement]):
@@ -335,16 +382,23 @@ class GrantStatement(Generic[G]):
         return result
 
 
-def _render_grant_or_revoke(grant: Grant) -> str:
-    if grant.revoke_:
-        return "REVOKE"
-    return "GRANT"
-
+def _explode_grant(grant: Grant[G]) -> list[Grant[G]]:
+    """Split a grant into one single-privilege grant per privilege.
 
-def _render_to_or_from(grant: Grant) -> str:
-    if grant.revoke_:
-        return f'FROM "{grant.target_role}"'
-    return f'TO "{grant.target_role}"'
+    The resulting (immutable) grants are shared between all exploded statements.
+    """
+    target_role = grant.target_role
+    grant_option = grant.grant_option
+    revoke = grant.revoke_
+    return [
+        Grant(
+            grants=(g,),
+            target_role=target_role,
+            grant_option=grant_option,
+            revoke_=revoke,
+        )
+        for g in grant.grants
+    ]
 
 
 def _quote_table_name(name: str):
@@ -355,28 +409,41 @@ def _quote_table_name(name: str):
     return f'"{name}"'
 
 
-def _render_privilege(grant: Grant, grant_type: DefaultGrantTypes | GrantTypes) -> str:
-    grant_variant_cls = grant_type.to_variants()
-    return ", ".join(v.value for v in grant_variant_cls.from_strings(grant.grants))
+@functools.lru_cache(maxsize=2048)
+def _render_privilege(grant_variant_cls: type[G], grants: tuple[str | G, ...]) -> str:
+    # The set of distinct (variant, privileges) combinations is small, while the
+    # number of rendered statements can be large.
+    return ", ".join(v.value for v in grant_variant_cls.from_strings(grants))
+
 
+def _sorted_tuple(items: Iterable[T]) -> tuple[T, ...]:
+    # Inputs are very commonly just one or two items long, which need no
+    # general-purpose sort.
+    result = tuple(items)
+    size = len(result)
+    if size < 2:
+        return result
 
-def _render_grant_option(grant: Grant) -> str | None:
-    if grant.grant_option:
-        return "WITH GRANT OPTION"
-    return None
+    if size == 2:
+        first, second = result
+        if second < first:
+            return (second, first)
+        return result
 
+    return tuple(sorted(result))
 
-def _map_schema_names(*schemas: str | HasName):
-    return sorted([_coerce_name(s) for s in schemas])
 
+def _map_schema_names(*schemas: str | HasName) -> tuple[str, ...]:
+    return _sorted_tuple(coerce_name(s) for s in schemas)
 
-def _map_grant_names(variant: G, *grants: str | G):
-    return sorted(
-        [g if isinstance(g, GrantOptions) else variant.from_string(g) for g in grants]
-    )
 
+# Exact-type lookup is cheaper than `isinstance` against the enum hierarchy. Any
+# other (e.g. subclassed) variant still passes through `from_string` unchanged.
+_grant_option_types = frozenset(GrantOptions.__subclasses__())
 
-def _coerce_name(name: str | HasName):
-    if isinstance(name, HasName):
-        return name.name
-    return name
+
+def _map_grant_names(variant: G, *grants: str | G) -> tuple[G, ...]:
+    return _sorted_tuple(
+        cast(G, g) if type(g) in _grant_option_types else variant.from_string(g)
+        for g in grants
+    )
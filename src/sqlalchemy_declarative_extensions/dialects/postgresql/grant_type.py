@@ -1,3 +1,4 @@
+import functools
 from typing import List, TypeVar
 
 from sqlalchemy_declarative_extensions.dialects.from_string import (
@@ -218,6 +219,7 @@ class GrantTypes(FromStrings):
     def from_relkind(cls, relkind: str):
         return cls._str_to_kind()[relkind]
 
+    @functools.lru_cache(maxsize=None)
     def to_variants(self):
         return {
             self.database: DatabaseGrants,
@@ -249,6 +251,7 @@ class DefaultGrantTypes(FromStrings):
     def from_relkind(cls, relkind: str):
         return cls._str_to_kind()[relkind]
 
+    @functools.lru_cache(maxsize=None)
     def to_variants(self):
         return {
             self.table: TableGrants,
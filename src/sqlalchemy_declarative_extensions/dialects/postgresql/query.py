@@ -3,8 +3,9 @@ from __future__ import annotations
 from collections.abc import Sequence
 from typing import Container, List, cast
 
-from sqlalchemy import Index, UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint, inspect
 from sqlalchemy.engine import Connection
+from sqlalchemy.engine.reflection import Inspector
 
 from sqlalchemy_declarative_extensions.dialects.postgresql import View, ViewIndex
 from sqlalchemy_declarative_extensions.dialects.postgresql.acl import (
@@ -136,8 +137,11 @@ def get_roles_postgresql(connection: Connection, exclude=None):
 
 
 def get_views_postgresql(connection: Connection):
+    raw_views = connection.execute(views_query).fetchall()
+    raw_indexes = _get_view_indexes(connection, [(v.schema, v.name) for v in raw_views])
+
     views = []
-    for v in connection.execute(views_query).fetchall():
+    for v in raw_views:
         schema = v.schema if v.schema != "public" else None
 
         indexes: list[ViewIndex | Index | UniqueConstraint] = [
@@ -146,7 +150,7 @@ def get_views_postgresql(connection: Connection):
                 unique=raw["unique"],
                 columns=cast(List[str], raw["column_names"]),
             )
-            for raw in connection.dialect.get_indexes(connection, v.name, schema=schema)
+            for raw in raw_indexes.get((v.schema, v.name), [])
         ]
         view = View(
             v.name,
@@ -159,6 +163,38 @@ def get_views_postgresql(connection: Connection):
     return views
 
 
+def _get_view_indexes(
+    connection: Connection, view_names: list[tuple[str, str]]
+) -> dict[tuple[str, str], list]:
+    """Reflect the indexes of the given (schema, name) views.
+
+    Where available (SQLAlchemy 2.0+), this uses the batched reflection API, issuing
+    one set of queries per schema rather than per view.
+    """
+    if not hasattr(Inspector, "get_multi_indexes"):
+        return {
+            (schema, name): connection.dialect.get_indexes(
+                connection, name, schema=schema
+            )
+            for schema, name in view_names
+        }
+
+    from sqlalchemy.engine.reflection import ObjectKind
+
+    names_by_schema: dict[str, list[str]] = {}
+    for schema, name in view_names:
+        names_by_schema.setdefault(schema, []).append(name)
+
+    inspector = inspect(connection)
+    result: dict[tuple[str, str], list] = {}
+    for schema, names in names_by_schema.items():
+        indexes = inspector.get_multi_indexes(
+            schema=schema, filter_names=names, kind=ObjectKind.ANY_VIEW
+        )
+        result.update(cast(dict, indexes))
+    return result
+
+
 def get_view_postgresql(connection: Connection, name: str, schema: str = "public"):
     result = connection.execute(view_query, {"schema": schema, "name": name}).fetchone()
     assert result
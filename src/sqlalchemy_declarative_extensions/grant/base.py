@@ -43,7 +43,9 @@ class Grants:
         - With some actual grants
 
         >>> from sqlalchemy_declarative_extensions.dialects.postgresql import DefaultGrant
-        >>> grants = Grants().are(DefaultGrant(..., ...), ...)
+        >>> grants = Grants().are(
+        ...     DefaultGrant.on_tables_in_schema("public").grant("select", to="app"),
+        ... )
     """
 
     grants: list[G] = field(default_factory=list)
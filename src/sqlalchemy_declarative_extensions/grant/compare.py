@@ -30,6 +30,9 @@ class GrantPrivilegesOp:
     def to_sql(self):
         return self.grant.to_sql()
 
+    def _to_sql_str(self) -> str:
+        return self.grant._to_sql_str()
+
 
 @dataclass
 class RevokePrivilegesOp:
@@ -41,6 +44,9 @@ class RevokePrivilegesOp:
     def to_sql(self):
         return self.grant.invert().to_sql()
 
+    def _to_sql_str(self) -> str:
+        return self.grant.invert()._to_sql_str()
+
 
 Operation = Union[GrantPrivilegesOp, RevokePrivilegesOp]
 
@@ -78,7 +84,7 @@ def compare_default_grants(
 
     existing_default_grants = get_default_grants(connection, roles=roles, expanded=True)
 
-    expected_grants = []
+    expected_grants: list[DefaultGrantStatement] = []
     for grant in grants:
         if not isinstance(grant, DefaultGrantStatement):
             continue
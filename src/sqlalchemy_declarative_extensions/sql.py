@@ -3,7 +3,7 @@ from __future__ import annotations
 import fnmatch
 from collections.abc import Sequence
 
-from sqlalchemy_declarative_extensions.typing import Protocol, runtime_checkable
+from sqlalchemy_declarative_extensions.typing import Protocol
 
 
 def qualify_name(schema: str | None, name: str, quote=False) -> str:
@@ -37,12 +37,19 @@ def match_name(name: str, globs: Sequence[str] | None) -> bool:
     return False
 
 
-@runtime_checkable
 class HasName(Protocol):
     name: str
 
 
 def coerce_name(name: str | HasName):
-    if isinstance(name, HasName):
-        return name.name
+    # Plain names are by far the most common input; skip the (failing) attribute
+    # lookup for them entirely.
+    if isinstance(name, str):
+        return name
+
+    # Duck-typed rather than `isinstance(name, HasName)`, because runtime protocol
+    # checks are comparatively expensive on this very hot path.
+    result = getattr(name, "name", None)
+    if isinstance(result, str):
+        return result
     return name
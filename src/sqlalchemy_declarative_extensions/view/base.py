@@ -557,15 +557,20 @@ class Views:
         if not isinstance(metadata, Sequence):
             metadata = [metadata]
 
-        naming_conventions = [m.naming_convention for m in metadata if m]
-        instances: list[Self] = [
-            m.info["views"] for m in metadata if m and m.info.get("views")
-        ]
+        # Look each `info` entry up once, and bail out before doing any other work
+        # in the (common) case where no views are declared at all.
+        instances: list[Self] = []
+        for m in metadata:
+            instance = m.info.get("views") if m else None
+            if instance:
+                instances.append(instance)
 
         instance_count = len(instances)
         if instance_count == 0:
             return None
 
+        naming_conventions = [m.naming_convention for m in metadata if m]
+
         if not all(
             x.ignore_unspecified == instances[0].ignore_unspecified
             and x.naming_convention == instances[0].naming_convention
@@ -1,9 +1,14 @@
 import pytest
+from sqlalchemy import MetaData, Table
 
 from sqlalchemy_declarative_extensions import Role
 from sqlalchemy_declarative_extensions.dialects.postgresql import (
     DefaultGrant,
+    DefaultGrantStatement,
+    DefaultGrantTypes,
     Grant,
+    GrantStatement,
+    GrantTypes,
     TableGrants,
 )
 from tests.utilities import render_sql
@@ -39,6 +44,27 @@ class TestGrant:
         expected_result = 'GRANT SELECT ON TABLE "bar", "baz" TO "foo";'
         assert expected_result == sql
 
+    def test_on_table_object(self):
+        table = Table("bar", MetaData())
+        grant = Grant.new("select", to="foo").on_tables(table)
+        sql = render_sql(grant.to_sql())
+
+        expected_result = 'GRANT SELECT ON TABLE "bar" TO "foo";'
+        assert expected_result == sql
+
+    def test_for_role_object(self):
+        grant = Grant.new("select", to="foo").on_tables("bar").for_role(Role("baz"))
+        sql = render_sql(grant.to_sql())
+
+        expected_result = 'GRANT SELECT ON TABLE "bar" TO "baz";'
+        assert expected_result == sql
+
+    def test_membership_sets(self):
+        grant = Grant.new("select", "insert", to="foo").on_tables("bar", "baz")
+
+        assert grant.targets_set == frozenset({"bar", "baz"})
+        assert grant.grants_set == frozenset({TableGrants.select, TableGrants.insert})
+
     def test_on_schemas(self):
         grant = Grant.new("usage", to="foo").on_schemas("bar", "meow")
         sql = render_sql(grant.to_sql())
@@ -46,6 +72,27 @@ class TestGrant:
         expected_result = 'GRANT USAGE ON SCHEMA "bar", "meow" TO "foo";'
         assert expected_result == sql
 
+    def test_subscripted_construction(self):
+        grant = Grant[TableGrants](grants=(TableGrants.select,), target_role="foo")
+        statement = GrantStatement[TableGrants](
+            grant=grant, grant_type=GrantTypes.table, targets=("bar",)
+        )
+        sql = render_sql(statement.to_sql())
+
+        expected_result = 'GRANT SELECT ON TABLE "bar" TO "foo";'
+        assert expected_result == sql
+
+        default_statement = DefaultGrantStatement[TableGrants](
+            default_grant=DefaultGrant(DefaultGrantTypes.table, in_schemas=("bar",)),
+            grant=grant,
+        )
+        sql = render_sql(default_statement.to_sql())
+
+        expected_result = (
+            'ALTER DEFAULT PRIVILEGES IN SCHEMA "bar" GRANT SELECT ON TABLES TO "foo";'
+        )
+        assert expected_result == sql
+
 
 class TestGrantDefault:
     def test_on_tables(self):
@@ -58,6 +105,24 @@ class TestGrantDefault:
         )
         assert expected_result == sql
 
+    @pytest.mark.parametrize(
+        "schemas, expected",
+        (
+            (("baz", "bar"), '"bar", "baz"'),
+            (("bar", "baz"), '"bar", "baz"'),
+            (("meow", "baz", "bar"), '"bar", "baz", "meow"'),
+        ),
+    )
+    def test_schemas_sorted(self, schemas, expected):
+        grant = DefaultGrant.on_tables_in_schema(*schemas).grant("select", to="foo")
+        sql = render_sql(grant.to_sql())
+
+        expected_result = (
+            f"ALTER DEFAULT PRIVILEGES IN SCHEMA {expected} "
+            'GRANT SELECT ON TABLES TO "foo";'
+        )
+        assert expected_result == sql
+
     def test_grant_type_object(self):
         grant = (
             DefaultGrant.on_tables_in_schema("bar", "baz")
@@ -72,6 +137,32 @@ class TestGrantDefault:
         )
         assert expected_result == sql
 
+    @pytest.mark.parametrize("role", ("test", Role("test")))
+    def test_for_role(self, role):
+        expected_result = (
+            'ALTER DEFAULT PRIVILEGES FOR ROLE "test" IN SCHEMA "bar" '
+            'GRANT SELECT ON TABLES TO "foo";'
+        )
+
+        grant = (
+            DefaultGrant.on_tables_in_schema("bar")
+            .for_role(role)
+            .grant("select", to="foo")
+        )
+        assert render_sql(grant.to_sql()) == expected_result
+
+        grant = (
+            DefaultGrant.on_tables_in_schema("bar")
+            .grant("select", to="foo")
+            .for_role(role)
+        )
+        assert render_sql(grant.to_sql()) == expected_result
+
+        grant = DefaultGrant.on_tables_in_schema("bar", for_role=role).grant(
+            "select", to="foo"
+        )
+        assert render_sql(grant.to_sql()) == expected_result
+
     def test_on_sequences(self):
         grant = DefaultGrant.on_sequences_in_schema("bar").grant("select", to="foo")
         sql = render_sql(grant.to_sql())
@@ -97,3 +188,49 @@ class TestGrantDefault:
             'ALTER DEFAULT PRIVILEGES IN SCHEMA "bar" GRANT USAGE ON TYPES TO "foo";'
         )
         assert expected_result == sql
+
+
+class TestRenderCache:
+    def test_grant_sql_is_cached(self):
+        grant = Grant.new("select", to="foo").on_tables("bar")
+        assert grant._to_sql_str() is grant._to_sql_str()
+
+        inverted = grant.invert()
+        assert (
+            render_sql(inverted.to_sql()) == 'REVOKE SELECT ON TABLE "bar" FROM "foo";'
+        )
+
+    def test_default_grant_sql_is_cached(self):
+        grant = DefaultGrant.on_tables_in_schema("bar").grant("select", to="foo")
+        assert grant._to_sql_str() is grant._to_sql_str()
+
+        # The cache does not participate in equality/hashing.
+        other = DefaultGrant.on_tables_in_schema("bar").grant("select", to="foo")
+        assert grant == other
+        assert hash(grant) == hash(other)
+
+
+class TestExplode:
+    def test_grant_explode(self):
+        grant = Grant.new("select", "insert", to="foo").on_tables("bar", "baz")
+        sql = [render_sql(g.to_sql()) for g in grant.explode()]
+
+        assert sql == [
+            'GRANT INSERT ON TABLE "bar" TO "foo";',
+            'GRANT SELECT ON TABLE "bar" TO "foo";',
+            'GRANT INSERT ON TABLE "baz" TO "foo";',
+            'GRANT SELECT ON TABLE "baz" TO "foo";',
+        ]
+
+    def test_default_grant_explode(self):
+        grant = DefaultGrant.on_tables_in_schema("bar", "baz").grant(
+            "select", "insert", to="foo"
+        )
+        sql = [render_sql(g.to_sql()) for g in grant.explode()]
+
+        assert sql == [
+            'ALTER DEFAULT PRIVILEGES IN SCHEMA "bar" GRANT INSERT ON TABLES TO "foo";',
+            'ALTER DEFAULT PRIVILEGES IN SCHEMA "bar" GRANT SELECT ON TABLES TO "foo";',
+            'ALTER DEFAULT PRIVILEGES IN SCHEMA "baz" GRANT INSERT ON TABLES TO "foo";',
+            'ALTER DEFAULT PRIVILEGES IN SCHEMA "baz" GRANT SELECT ON TABLES TO "foo";',
+        ]
@@ -0,0 +1,53 @@
+import ast
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from sqlalchemy_declarative_extensions.alembic.base import render_execute
+from sqlalchemy_declarative_extensions.alembic.view import render_view
+from sqlalchemy_declarative_extensions.view.base import View
+from sqlalchemy_declarative_extensions.view.compare import CreateViewOp
+
+prefix, suffix = "op.execute(", ")"
+
+
+def _parse_execute(line: str) -> str:
+    assert line.startswith(prefix) and line.endswith(suffix)
+    return ast.literal_eval(line[len(prefix) : -len(suffix)])
+
+
+def test_render_view_escapes_definition():
+    dialect = postgresql.dialect()
+    autogen_context = SimpleNamespace(connection=SimpleNamespace(dialect=dialect))
+    view = View("foo", 'SELECT \'a"""b\\:c\' AS x')
+
+    result = render_view(autogen_context, CreateViewOp(view))  # type: ignore
+
+    commands = [_parse_execute(line) for line in result]
+    assert commands == view.to_sql_create(dialect)
+
+
+def test_render_view_keeps_multiline_definition():
+    dialect = postgresql.dialect()
+    autogen_context = SimpleNamespace(connection=SimpleNamespace(dialect=dialect))
+    view = View("foo", "SELECT a,\n   b\nFROM bar")
+
+    result = render_view(autogen_context, CreateViewOp(view))  # type: ignore
+
+    assert all(line.startswith('op.execute("""') for line in result)
+    assert "\n   b\nFROM bar" in result[0]
+
+
+@pytest.mark.parametrize(
+    "command",
+    (
+        'SELECT 1 AS "x"',
+        'SELECT 1 AS "x""',
+        'SELECT """"""',
+        "SELECT '\\n', '\\\\'",
+        'SELECT "\\"',
+    ),
+)
+def test_render_execute_round_trips(command):
+    assert _parse_execute(render_execute(command)) == command